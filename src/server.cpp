@@ -74,7 +74,11 @@ class DLL_LOCAL tuber_resource : public http_resource {
 			 */
 			py::gil_scoped_acquire acquire;
 
-			py::tuple resp = handler(req.get_content(), req.get_headers());
+			/* Pass the request body as bytes: it may be binary
+			 * (e.g. CBOR), and all codecs accept bytes directly,
+			 * so there is no need to decode it to a str first. */
+			auto content = req.get_content();
+			py::tuple resp = handler(py::bytes(content.data(), content.size()), req.get_headers());
 
 			std::string responseFormat = resp[0].cast<std::string>();
 			std::string response = resp[1].cast<std::string>();
@@ -1,8 +1,13 @@
+import aiohttp
+import functools
 import os
 import pytest
+import pytest_asyncio
 import requests
+import socket
 import subprocess
 import sys
+import time
 import warnings
 
 from tuber import codecs
@@ -25,8 +30,8 @@ def pytest_addoption(parser):
     # changes test behaviour.
     parser.addoption("--orjson", action="store_true", default=False)
 
-    # Allow tuberd port to be specified
-    parser.addoption("--tuberd-port", default=8080)
+    # Allow tuberd port to be specified (by default, any free port is used)
+    parser.addoption("--tuberd-port", default=None, type=int)
 
 
 # Some tests require orjson - the following skips them unless we're in
@@ -40,16 +45,28 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.skip(reason="Test depends on orjson fastpath"))
 
 
+@pytest.fixture(scope="session")
+def tuberd_port(pytestconfig):
+    port = pytestconfig.getoption("tuberd_port")
+    if port is None:
+        # Let the OS pick an unused port, so that concurrent test runs (e.g.
+        # pytest-xdist workers) don't collide.
+        with socket.socket() as s:
+            s.bind(("", 0))
+            port = s.getsockname()[1]
+    return port
+
+
 @pytest.fixture(scope="module")
-def tuberd_host(pytestconfig):
-    return f"localhost:{pytestconfig.getoption('tuberd_port')}"
+def tuberd_host(tuberd_port):
+    return f"localhost:{tuberd_port}"
 
 
 @pytest.fixture(scope="module", autouse=True)
-def tuberd(request, pytestconfig):
+def tuberd(request, pytestconfig, tuberd_port):
     """Spawn (and kill) a tuberd"""
 
-    TUBERD_PORT = pytestconfig.getoption("tuberd_port")
+    TUBERD_PORT = tuberd_port
 
     if os.getenv("CMAKE_TEST"):
         tuberd = [sys.executable, "-m", "tuber.server"]
@@ -74,10 +91,56 @@ def tuberd(request, pytestconfig):
         argv.extend(["--json", "orjson"])
 
     s = subprocess.Popen(argv)
+
+    # The tuber daemon can take a little while to start (in particular, it
+    # sources this script as a registry) - rather than adding a magic sleep to
+    # the subprocess command, poll it with an empty batch until it answers.
+    uri = f"http://localhost:{TUBERD_PORT}/tuber"
+    # Back off exponentially from a small base, capped so a slow start is
+    # still noticed promptly.
+    deadline = time.monotonic() + 30
+    delay = 0.01
+    while True:
+        if s.poll() is not None:
+            pytest.fail(f"tuberd exited during startup with code {s.returncode}")
+        try:
+            requests.post(uri, json=[], timeout=0.5)
+            break
+        except requests.ConnectionError:
+            if time.monotonic() > deadline:
+                s.terminate()
+                pytest.fail("tuberd did not start within 30 seconds")
+            time.sleep(delay)
+            delay = min(2 * delay, 0.25)
+
     yield s
     s.terminate()
 
 
+# Encode request bodies as bytes, using orjson where available (which
+# produces bytes natively) and the standard library otherwise.
+if "orjson" in codecs.Codecs:
+    _encode_body = codecs.Codecs["orjson"].encode
+else:
+    _encode_body = lambda d: codecs.Codecs["json"].encode(d).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_cached(items):
+    return _encode_body({k: v for k, _, v in items})
+
+
+def encode_body(payload):
+    # Many tests repeat the same flat keyword payload; cache their encodings.
+    # Values are keyed with their type too, since e.g. 1 == 1.0 == True.
+    if isinstance(payload, dict):
+        try:
+            return _encode_cached(tuple((k, type(v), v) for k, v in payload.items()))
+        except TypeError:
+            pass  # unhashable values (lists, dicts) - encode directly
+    return _encode_body(payload)
+
+
 # This fixture provides a much simpler, synchronous wrapper for functionality
 # normally provided by tuber.py.  It's coded directly - which makes it less
 # flexible, less performant, and easier to understand here.
@@ -88,12 +151,12 @@ def tuber_call(request, tuberd_host):
     accept = f"application/{request.param}"
     loads = lambda d: codecs.AcceptTypes[accept](d, encoding="utf-8", convert=False)
 
-    # The tuber daemon can take a little while to start (in particular, it
-    # sources this script as a registry) - rather than adding a magic sleep to
-    # the subprocess command, we teach the client interface to wait patiently.
-    adapter = requests.adapters.HTTPAdapter(
-        max_retries=requests.packages.urllib3.util.retry.Retry(total=10, backoff_factor=1)
-    )
+    headers = {"Accept": accept, "Content-Type": "application/json"}
+
+    # Everything goes to a single host; keep its connection(s) alive across
+    # calls rather than re-opening one per request. The tuberd fixture has
+    # already waited for the server, so no retries are needed here.
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
     session = requests.Session()
     session.mount(URI, adapter)
 
@@ -102,12 +165,27 @@ def tuber_call(request, tuberd_host):
         # "json" parameter.  However, for convenience's sake, we also allow
         # kwargs to supply a dict parameter since we often call with dicts and
         # this results in a more readable code style.
-        return loads(
-            session.post(
-                URI,
-                json=kwargs if json is None else json,
-                headers={"Accept": accept},
-            ).content
-        )
+        body = encode_body(kwargs if json is None else json)
+        return loads(session.post(URI, data=body, headers=headers).content)
 
     yield tuber_call
+
+
+# Asynchronous counterpart to tuber_call, for tests that issue independent
+# requests concurrently over a shared aiohttp connection pool.
+@pytest_asyncio.fixture(params=["json", "cbor"])
+async def tuber_call_async(request, tuberd_host):
+    URI = f"http://{tuberd_host}/tuber"
+
+    accept = f"application/{request.param}"
+    loads = lambda d: codecs.AcceptTypes[accept](d, encoding="utf-8", convert=False)
+    headers = {"Accept": accept, "Content-Type": "application/json"}
+
+    async with aiohttp.ClientSession() as session:
+
+        async def tuber_call_async(json=None, **kwargs):
+            body = encode_body(kwargs if json is None else json)
+            async with session.post(URI, data=body, headers=headers) as r:
+                return loads(await r.read())
+
+        yield tuber_call_async
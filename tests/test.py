@@ -1,13 +1,18 @@
 #!/usr/bin/env -S pytest -svv
 
 import aiohttp
+import array
 import asyncio
+import functools
+import gc
 import importlib
 import inspect
+import math
 import numpy as np
 import os
 import pytest
 import warnings
+import weakref
 import tuber
 
 if os.getenv("CMAKE_TEST"):
@@ -15,7 +20,7 @@ if os.getenv("CMAKE_TEST"):
 else:
     from tuber.tests import test_module as tm
 
-from tuber.server import TuberContainer, TuberArray
+from tuber.server import RequestHandler, TuberArray, TuberContainer, TuberRegistry
 
 
 # REGISTRY DEFINITIONS
@@ -37,6 +42,11 @@ class ObjectWithDictMethod:
         return {"a": "expected return value", "b": "expected return value"}
 
 
+class ObjectWithUnencodableMethod:
+    def method(self):
+        return NullObject()
+
+
 class ObjectWithProperty:
     PROPERTY = "expected property value"
 
@@ -84,10 +94,28 @@ class Types:
     def bytes_function(self, arg=None):
         return self.BYTES
 
+    def int_key_dict_function(self):
+        return {1: "one", 2: "two"}
+
+    def non_finite_function(self):
+        return [float("nan"), float("inf"), -float("inf")]
+
 
 class NumPy:
     def returns_numpy_array(self):
-        return np.array([0, 1, 2, 3])
+        return np.array([0, 1, 2, 3], dtype=np.int64)
+
+    def returns_float_array(self):
+        return np.array([0.0, 0.5, 1.25, -2.75], dtype=np.float32)
+
+    def returns_2d_array(self):
+        return np.arange(12, dtype=np.float64).reshape(3, 4)
+
+    def returns_array_array(self):
+        return array.array("d", [0.0, 0.5, 1.25, -2.75])
+
+    def returns_large_numpy_array(self):
+        return np.arange(1_000_000, dtype=np.float64)
 
 
 class WarningsClass:
@@ -111,24 +139,34 @@ class WarningsClass:
         return True
 
 
-registry = {
-    "NullObject": NullObject(),
-    "ObjectWithMethod": ObjectWithMethod(),
-    "ObjectWithDictMethod": ObjectWithDictMethod(),
-    "ObjectWithProperty": ObjectWithProperty(),
-    "ObjectWithPrivateMethod": ObjectWithPrivateMethod(),
-    "ObjectWithContainerProperties": ObjectWithContainerProperties(),
-    "ObjectList": TuberArray([ObjectWithContainerProperties(), ObjectWithContainerProperties()]),
-    "ObjectDict": TuberArray({"a": ObjectWithContainerProperties(), "b": ObjectWithContainerProperties()}),
-    "ObjectListList": TuberArray(
-        [TuberArray([ObjectWithContainerProperties()]), TuberArray([ObjectWithContainerProperties])]
-    ),
-    "Container": TuberContainer({"a": ObjectWithProperty(), "b": ObjectWithMethod()}),
-    "Types": Types(),
-    "NumPy": NumPy(),
-    "Warnings": WarningsClass(),
-    "Wrapper": tm.Wrapper(),
-}
+class QuietWarningsClass(WarningsClass):
+    __tuber_record_warnings__ = False
+
+
+# The registry is supplied as a factory, so its objects are only built when
+# tuberd (or a test) actually asks for them rather than on every import.
+@functools.cache
+def registry():
+    return {
+        "NullObject": NullObject(),
+        "ObjectWithMethod": ObjectWithMethod(),
+        "ObjectWithDictMethod": ObjectWithDictMethod(),
+        "ObjectWithUnencodableMethod": ObjectWithUnencodableMethod(),
+        "ObjectWithProperty": ObjectWithProperty(),
+        "ObjectWithPrivateMethod": ObjectWithPrivateMethod(),
+        "ObjectWithContainerProperties": ObjectWithContainerProperties(),
+        "ObjectList": TuberArray([ObjectWithContainerProperties(), ObjectWithContainerProperties()]),
+        "ObjectDict": TuberArray({"a": ObjectWithContainerProperties(), "b": ObjectWithContainerProperties()}),
+        "ObjectListList": TuberArray(
+            [TuberArray([ObjectWithContainerProperties()]), TuberArray([ObjectWithContainerProperties])]
+        ),
+        "Container": TuberContainer({"a": ObjectWithProperty(), "b": ObjectWithMethod()}),
+        "Types": Types(),
+        "NumPy": NumPy(),
+        "Warnings": WarningsClass(),
+        "QuietWarnings": QuietWarningsClass(),
+        "Wrapper": tm.Wrapper(),
+    }
 
 
 #
@@ -154,14 +192,38 @@ def Failed(warnings=None, **kwargs):
 
 container_success = Succeeded(__doc__=TuberArray.__doc__.strip(), methods=["tuber_call", "tuber_meta"], properties=[])
 
+# Expected envelopes for the Types registry entry, built once at import time
+# rather than in every assertion.
+EXPECTED_STRING = Succeeded(Types.STRING)
+EXPECTED_INTEGER = Succeeded(Types.INTEGER)
+EXPECTED_FLOAT = Succeeded(pytest.approx(Types.FLOAT))
+EXPECTED_LIST = Succeeded(Types.LIST)
+EXPECTED_DICT = Succeeded(Types.DICT)
+EXPECTED_BYTES = Succeeded(Types.BYTES)
+
+# Other envelopes that recur across tests
+EXPECTED_EMPTY_META = Succeeded(__doc__=None, methods=[], properties=[])
+EXPECTED_RETURN_VALUE = Succeeded("expected return value")
+EXPECTED_PROPERTY_VALUE = Succeeded("expected property value")
+
+# Each Types entry as (property name, function name, expected envelope)
+TYPES = [
+    ("STRING", "string_function", EXPECTED_STRING),
+    ("INTEGER", "integer_function", EXPECTED_INTEGER),
+    ("FLOAT", "float_function", EXPECTED_FLOAT),
+    ("LIST", "list_function", EXPECTED_LIST),
+    ("DICT", "dict_function", EXPECTED_DICT),
+    ("BYTES", "bytes_function", EXPECTED_BYTES),
+]
+
 
 def test_empty_request_array(tuber_call):
     assert tuber_call(json=[]) == []
 
 
 def test_describe(tuber_call):
-    assert tuber_call(json={}) == Succeeded(objects=list(registry))
-    assert tuber_call(object="ObjectWithPrivateMethod") == Succeeded(__doc__=None, methods=[], properties=[])
+    assert tuber_call(json={}) == Succeeded(objects=list(registry()))
+    assert tuber_call(object="ObjectWithPrivateMethod") == EXPECTED_EMPTY_META
 
     assert tuber_call(object="ObjectWithContainerProperties", property="property_objects") == container_success
     assert tuber_call(object=["ObjectWithContainerProperties", "property_objects"]) == container_success
@@ -176,11 +238,11 @@ def test_describe(tuber_call):
     assert tuber_call(object="ObjectList") == container_success
     assert tuber_call(object=[("ObjectListList", 0)]) == container_success
     assert tuber_call(object="ObjectDict") == container_success
-    assert tuber_call(object=[("ObjectDict", "a")]) == Succeeded(__doc__=None, methods=[], properties=[])
+    assert tuber_call(object=[("ObjectDict", "a")]) == EXPECTED_EMPTY_META
 
 
 def test_fetch_null_metadata(tuber_call):
-    assert tuber_call(object="NullObject") == Succeeded(__doc__=None, methods=[], properties=[])
+    assert tuber_call(object="NullObject") == EXPECTED_EMPTY_META
 
 
 def test_call_nonexistent_object(tuber_call):
@@ -195,51 +257,219 @@ def test_call_nonexistent_method(tuber_call):
     )
 
 
-def test_property_types(tuber_call):
-    assert tuber_call(object="Types", property="STRING") == Succeeded(Types.STRING)
-    assert tuber_call(object="Types", property="INTEGER") == Succeeded(Types.INTEGER)
-    assert tuber_call(object="Types", property="FLOAT") == Succeeded(pytest.approx(Types.FLOAT))
-    assert tuber_call(object="Types", property="LIST") == Succeeded(Types.LIST)
-    assert tuber_call(object="Types", property="DICT") == Succeeded(Types.DICT)
-    assert tuber_call(object="Types", property="BYTES") == Succeeded(Types.BYTES)
+def test_registry_reassignment():
+    """Ensure cached lookups follow changes to the registry"""
+    reg = TuberRegistry(x=ObjectWithMethod())
+    handler = RequestHandler(reg)
+    assert handler.invoke({"object": "x"})["result"]["methods"] == ["method"]
 
+    reg.x = ObjectWithProperty()
+    assert handler.invoke({"object": "x"})["result"]["properties"] == ["PROPERTY"]
 
-def test_function_types_with_default_arguments(tuber_call):
-    assert tuber_call(object="Types", method="string_function") == Succeeded(Types.STRING)
-    assert tuber_call(object="Types", method="integer_function") == Succeeded(Types.INTEGER)
-    assert tuber_call(object="Types", method="float_function") == Succeeded(pytest.approx(Types.FLOAT))
-    assert tuber_call(object="Types", method="list_function") == Succeeded(Types.LIST)
-    assert tuber_call(object="Types", method="dict_function") == Succeeded(Types.DICT)
-    assert tuber_call(object="Types", method="bytes_function") == Succeeded(Types.BYTES)
 
+def test_registry_method_reassignment():
+    """Ensure cached methods follow changes to the registry"""
+    reg = TuberRegistry(x=ObjectWithMethod())
+    handler = RequestHandler(reg)
+    assert handler.invoke({"object": "x", "method": "method"}) == EXPECTED_RETURN_VALUE
 
-def test_function_types_with_correct_argument_types(tuber_call):
-    assert tuber_call(object="Types", method="string_function", args=["this is a string"]) == Succeeded(
-        "this is a string"
+    reg.x = ObjectWithDictMethod()
+    assert handler.invoke({"object": "x", "method": "method"}) == Succeeded(
+        a="expected return value", b="expected return value"
     )
-    assert tuber_call(object="Types", method="integer_function", args=[6789]) == Succeeded(6789)
-    assert tuber_call(object="Types", method="float_function", args=[67.89]) == Succeeded(pytest.approx(67.89))
-    assert tuber_call(object="Types", method="list_function", args=[[3, 4, 5, 6]]) == Succeeded([3, 4, 5, 6])
-    assert tuber_call(object="Types", method="dict_function", args=[dict(one="two", three="four")]) == Succeeded(
-        one="two", three="four"
+
+
+def test_container_item_reassignment():
+    """Ensure container items are looked up afresh on every request"""
+    items = [ObjectWithMethod()]
+    handler = RequestHandler(TuberRegistry(arr=TuberArray(items)))
+    request = {"object": [["arr", 0]], "method": "method"}
+    assert handler.invoke(request) == EXPECTED_RETURN_VALUE
+
+    items[0] = ObjectWithDictMethod()
+    assert handler.invoke(request) == Succeeded(a="expected return value", b="expected return value")
+
+
+def test_patched_methods():
+    """Ensure methods replaced on an object or its class take effect"""
+
+    class Patchable:
+        def method(self):
+            return "original"
+
+    obj = Patchable()
+    handler = RequestHandler(TuberRegistry(x=obj))
+    request = {"object": "x", "method": "method"}
+    assert handler.invoke(request) == Succeeded("original")
+
+    Patchable.method = lambda self: "class"
+    assert handler.invoke(request) == Succeeded("class")
+
+    obj.method = lambda: "instance"
+    assert handler.invoke(request) == Succeeded("instance")
+
+
+def test_property_path_not_cached():
+    """Ensure paths through properties are resolved on every lookup"""
+
+    class ObjectWithSwappingChild:
+        swap = False
+
+        @property
+        def child(self):
+            self.swap = not self.swap
+            return ObjectWithMethod() if self.swap else ObjectWithProperty()
+
+    handler = RequestHandler(TuberRegistry(x=ObjectWithSwappingChild()))
+    assert handler.invoke({"object": ["x", "child"]})["result"]["methods"] == ["method"]
+    assert handler.invoke({"object": ["x", "child"]})["result"]["properties"] == ["PROPERTY"]
+
+
+def test_class_attribute_signature():
+    """Ensure callable class attributes are described with their signature"""
+
+    class Klass:
+        """A class"""
+
+        def __init__(self, a, b=2):
+            pass
+
+    class ObjectWithClass:
+        klass = Klass
+
+    handler = RequestHandler(TuberRegistry(x=ObjectWithClass()))
+    r = handler.invoke({"object": "x", "property": "klass"})["result"]
+    assert r["__doc__"] == "A class"
+    assert [p["name"] for p in r["__signature__"]["parameters"]] == ["self", "a", "b"]
+
+
+def test_inherited_method_docstring():
+    """Ensure overriding methods are described with inherited docstrings"""
+
+    class Base:
+        def method(self):
+            """Base doc"""
+
+    class Sub(Base):
+        def method(self):
+            pass
+
+    handler = RequestHandler(TuberRegistry(x=Sub()))
+    assert handler.invoke({"object": "x", "property": "method"})["result"]["__doc__"] == "Base doc"
+
+
+def test_method_descriptions_do_not_pin_objects():
+    """Ensure describing per-instance callables does not keep their objects alive"""
+
+    class Item:
+        def __init__(self):
+            self.callback = lambda: self
+
+    class ObjectWithItem:
+        @property
+        def item(self):
+            item = Item()
+            refs.append(weakref.ref(item))
+            return item
+
+    refs = []
+    handler = RequestHandler(TuberRegistry(x=ObjectWithItem()))
+    for _ in range(10):
+        assert "callback" in handler.invoke({"object": ["x", "item"], "resolve": True})["result"]["methods"]
+
+    gc.collect()
+    assert not any(r() for r in refs)
+
+
+def test_unencodable_result_in_batch(tuber_call):
+    """Ensure a result that cannot be encoded does not spoil the rest of a batch"""
+    r1, r2 = tuber_call(
+        json=[
+            {"object": "ObjectWithUnencodableMethod", "method": "method"},
+            {"object": "ObjectWithMethod", "method": "method"},
+        ]
+    )
+    assert "error" in r1
+    assert r2 == EXPECTED_RETURN_VALUE
+
+
+def test_non_finite_float_result(tuber_call, pytestconfig):
+    """Ensure the default JSON codec preserves NaN and infinities"""
+    if pytestconfig.getoption("orjson"):
+        pytest.skip("orjson encodes non-finite floats as null")
+
+    nan, inf, ninf = tuber_call(object="Types", method="non_finite_function")["result"]
+    assert math.isnan(nan)
+    assert (inf, ninf) == (math.inf, -math.inf)
+
+
+# Each group of Types calls is issued as a single batched request, shared
+# across the parametrized test cases that check the individual results.
+ARGUMENT_TYPES = [
+    ("string_function", "this is a string", Succeeded("this is a string")),
+    ("integer_function", 6789, Succeeded(6789)),
+    ("float_function", 67.89, Succeeded(pytest.approx(67.89))),
+    ("list_function", [3, 4, 5, 6], Succeeded([3, 4, 5, 6])),
+    ("dict_function", dict(one="two", three="four"), Succeeded(one="two", three="four")),
+]
+
+
+@pytest.fixture(scope="module")
+def property_results(tuber_call):
+    return tuber_call(json=[dict(object="Types", property=p) for p, _, _ in TYPES])
+
+
+@pytest.fixture(scope="module")
+def default_argument_results(tuber_call):
+    return tuber_call(json=[dict(object="Types", method=m) for _, m, _ in TYPES])
+
+
+@pytest.fixture(scope="module")
+def argument_results(tuber_call):
+    return tuber_call(json=[dict(object="Types", method=m, args=[a]) for m, a, _ in ARGUMENT_TYPES])
+
+
+@pytest.mark.parametrize("index", range(len(TYPES)), ids=[p for p, _, _ in TYPES])
+def test_property_types(property_results, index):
+    assert property_results[index] == TYPES[index][2]
+
+
+@pytest.mark.parametrize("index", range(len(TYPES)), ids=[m for _, m, _ in TYPES])
+def test_function_types_with_default_arguments(default_argument_results, index):
+    assert default_argument_results[index] == TYPES[index][2]
+
+
+@pytest.mark.parametrize("index", range(len(ARGUMENT_TYPES)), ids=[m for m, _, _ in ARGUMENT_TYPES])
+def test_function_types_with_correct_argument_types(argument_results, index):
+    assert argument_results[index] == ARGUMENT_TYPES[index][2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_types(tuber_call_async):
+    # Independent requests, issued concurrently rather than batched
+    results = await asyncio.gather(
+        *(tuber_call_async(object="Types", property=p) for p, _, _ in TYPES),
+        *(tuber_call_async(object="Types", method=m) for _, m, _ in TYPES),
     )
+    assert results == [expected for _, _, expected in TYPES] * 2
 
 
 def test_container_properties(tuber_call):
-    assert tuber_call(
-        object=["ObjectWithContainerProperties", ("property_objects", 0)], property="PROPERTY"
-    ) == Succeeded("expected property value")
-    assert tuber_call(object=["ObjectWithContainerProperties", ("method_objects", "a")], method="method") == Succeeded(
-        "expected return value"
+    assert (
+        tuber_call(object=["ObjectWithContainerProperties", ("property_objects", 0)], property="PROPERTY")
+        == EXPECTED_PROPERTY_VALUE
     )
-    assert tuber_call(object=[("ObjectList", 0), ("method_objects", "a")], method="method") == Succeeded(
-        "expected return value"
+    assert (
+        tuber_call(object=["ObjectWithContainerProperties", ("method_objects", "a")], method="method")
+        == EXPECTED_RETURN_VALUE
     )
-    assert tuber_call(object=[("ObjectDict", "a"), ("property_objects", 0)], property="PROPERTY") == Succeeded(
-        "expected property value"
+    assert tuber_call(object=[("ObjectList", 0), ("method_objects", "a")], method="method") == EXPECTED_RETURN_VALUE
+    assert (
+        tuber_call(object=[("ObjectDict", "a"), ("property_objects", 0)], property="PROPERTY")
+        == EXPECTED_PROPERTY_VALUE
     )
-    assert tuber_call(object=[("ObjectListList", 1, 0), ("method_objects", "a")], method="method") == Succeeded(
-        "expected return value"
+    assert (
+        tuber_call(object=[("ObjectListList", 1, 0), ("method_objects", "a")], method="method") == EXPECTED_RETURN_VALUE
     )
 
 
@@ -270,6 +500,32 @@ def test_numpy_types(tuber_call):
     )
 
 
+@pytest.mark.orjson
+def test_numpy_float_and_2d_arrays(tuber_call):
+    # Both orjson and CBOR serialize C-contiguous arrays of these dtypes
+    # directly. The float32 values are exactly representable, so they survive
+    # orjson's shortest-repr formatting unchanged.
+    result = tuber_call(object="NumPy", method="returns_float_array")["result"]
+    assert np.array_equal(result, NumPy().returns_float_array())
+
+    result = tuber_call(object="NumPy", method="returns_2d_array")["result"]
+    assert np.array_equal(result, NumPy().returns_2d_array())
+
+
+def test_array_array(tuber_call):
+    # array.array results are sent as CBOR typed arrays, or as lists in JSON
+    result = tuber_call(object="NumPy", method="returns_array_array")["result"]
+    assert list(result) == [0.0, 0.5, 1.25, -2.75]
+
+
+@pytest.mark.orjson
+def test_large_numpy_array(tuber_call):
+    # Large arrays should be handed to the encoder (orjson or CBOR) directly,
+    # without an intermediate conversion to a Python list.
+    result = tuber_call(object="NumPy", method="returns_large_numpy_array")
+    assert np.array_equal(result["result"], np.arange(1_000_000, dtype=np.float64))
+
+
 @pytest.mark.orjson
 def test_double_vector(tuber_call):
     assert tuber_call(object="Wrapper", method="increment", args=[[1, 2, 3, 4, 5]]) == Succeeded([2, 3, 4, 5, 6])
@@ -369,6 +625,19 @@ ACCEPT_TYPES = {
 }
 
 
+def test_default_accept_types_prefer_cbor(tuberd_host):
+    pytest.importorskip("cbor2")
+    s = tuber.SimpleTuberObject(None, hostname=tuberd_host)
+    assert s.tuber_context().accept_types == ["application/cbor", "application/json"]
+
+
+@pytest.mark.parametrize("accept_types", [None] + list(ACCEPT_TYPES.values()))
+def test_tuberpy_non_string_keys(accept_types, tuberd_host):
+    """Ensure results with non-string keys convert alike for every codec"""
+    s = tuber.resolve_simple(tuberd_host, "Types", accept_types)
+    assert vars(s.int_key_dict_function()) == {"1": "one", "2": "two"}
+
+
 @pytest.fixture(scope="module", params=list(ACCEPT_TYPES))
 def accept_types(request):
     return ACCEPT_TYPES[request.param]
@@ -425,6 +694,28 @@ async def test_tuberpy_hello(resolve):
     assert x == [2, 3, 4, 5, 6]
 
 
+@pytest.mark.parametrize("extra", [[], [None], ["null"], [np.float32(math.nan)]])
+def test_tuberpy_encode_request(extra):
+    """Ensure request bodies accept the same inputs whichever JSON encoder is used"""
+    body = tuber.client._encode_request([{"args": [np.arange(3)] + extra}])
+    args = tuber.codecs.Codecs["json"].decode(body)[0]["args"]
+    assert args[0] == [0, 1, 2]
+    assert len(args) == 1 + len(extra)
+    if extra and isinstance(extra[0], np.floating):
+        assert math.isnan(args[1])
+
+
+@pytest.mark.asyncio
+async def test_tuberpy_non_finite_float_argument(resolve, pytestconfig):
+    """Ensure NaN and infinite arguments survive the round trip"""
+    if pytestconfig.getoption("orjson"):
+        pytest.skip("orjson encodes non-finite floats as null")
+
+    s = await resolve("Types")
+    assert math.isnan(await tuber_result(s.float_function(math.nan)))
+    assert await tuber_result(s.float_function(-math.inf)) == -math.inf
+
+
 @pytest.mark.asyncio
 async def test_tuberpy_dir(resolve):
     """Ensure embedded methods end up in dir() of objects.
@@ -432,6 +723,7 @@ async def test_tuberpy_dir(resolve):
     This is a crude proxy for the ability to tab-complete."""
     s = await resolve("Wrapper")
     assert "increment" in dir(s)
+    assert "increment" in s.tuber_names
 
 
 @pytest.mark.asyncio
@@ -466,6 +758,48 @@ async def test_tuberpy_session_cache(accept_types, tuberd_host):
     assert aiohttp.ClientSession  # type: ignore[truthy-function]
 
 
+@pytest.mark.asyncio
+async def test_tuberpy_coalesced_calls(accept_types, tuberd_host, monkeypatch):
+    """Ensure independently awaited calls can be coalesced, with errors
+    confined to the call that caused them."""
+    monkeypatch.setattr(tuber.client, "coalesce_window", 0.005)
+    s = await tuber.resolve(tuberd_host, "Wrapper", accept_types)
+
+    r1, r2, r3 = await asyncio.gather(
+        s.increment([1, 2]),
+        s.increment(4),  # wrong type
+        s.increment([3]),
+        return_exceptions=True,
+    )
+
+    assert r1 == [2, 3]
+    assert isinstance(r2, tuber.TuberRemoteError)
+    assert r3 == [4]
+
+
+@pytest.mark.asyncio
+async def test_tuberpy_coalesced_calls_return_exceptions(accept_types, tuberd_host, monkeypatch):
+    """Ensure coalesced calls on objects that return exceptions do so, as
+    uncoalesced calls would."""
+    monkeypatch.setattr(tuber.client, "coalesce_window", 0.005)
+    s = await tuber.resolve(tuberd_host, "Wrapper", accept_types, return_exceptions=True)
+
+    r1, r2 = await asyncio.gather(s.increment([1, 2]), s.increment(4))  # wrong type
+
+    assert r1 == [2, 3]
+    assert isinstance(r2, tuber.TuberRemoteError)
+
+
+@pytest.mark.asyncio
+async def test_tuberpy_no_coalesce(accept_types, tuberd_host, monkeypatch):
+    """Ensure individual calls can opt out of coalescing."""
+    monkeypatch.setattr(tuber.client, "coalesce_window", 60)
+    s = await tuber.resolve(tuberd_host, "Wrapper", accept_types)
+
+    r = await asyncio.wait_for(s.increment([1, 2], tuber_no_coalesce=True), 5)
+    assert r == [2, 3]
+
+
 @pytest.mark.asyncio
 async def test_tuberpy_async_context(resolve):
     """Ensure we can use tuber_contexts to batch calls."""
@@ -496,6 +830,56 @@ async def test_tuberpy_async_context_with_kwargs(resolve):
     assert r2 == [2, 3, 4]
 
 
+@pytest.mark.asyncio
+async def test_tuberpy_async_context_with_max_batch(resolve):
+    """Ensure contexts flush automatically every max_batch calls, and that
+    calling the context returns results for every queued call."""
+    s = await resolve("Wrapper")
+
+    ctx = tuber_context(s, max_batch=2)
+    rs = [ctx.increment([n]) for n in range(5)]
+    results = await ctx()
+
+    assert results == [[n + 1] for n in range(5)]
+    assert await asyncio.gather(*map(tuber_result, rs)) == results
+
+
+@pytest.mark.asyncio
+async def test_tuberpy_async_context_with_max_batch_error(resolve):
+    """Ensure calls after a failed automatic flush are cancelled, whether they
+    were batched separately or still queued, rather than sent."""
+    s = await resolve("Wrapper")
+
+    ctx = tuber_context(s, max_batch=2)
+    ctx.increment([1])
+    ctx.increment(4)  # wrong type
+    rs = [ctx.increment([n]) for n in range(3, 6)]
+
+    with pytest.raises(tuber.TuberRemoteError):
+        await ctx()
+
+    assert not ctx.calls
+    assert all(r.cancelled() for r in rs)
+
+    # ...unless exceptions are returned, in which case every batch is sent
+    ctx = tuber_context(s, max_batch=2, return_exceptions=True)
+    for x in ([1], 4, [3], [4], [5]):
+        ctx.increment(x)
+    results = await ctx()
+
+    assert isinstance(results[1], tuber.TuberRemoteError)
+    assert results[:1] + results[2:] == [[2], [4], [5], [6]]
+
+
+@pytest.mark.asyncio
+async def test_tuberpy_map(resolve):
+    """Ensure tuber_map batches one call per set of arguments."""
+    s = await resolve("Wrapper")
+
+    r = await tuber_result(s.tuber_map("increment", [[1, 2, 3], [4, 5]]))
+    assert r == [[2, 3, 4], [5, 6]]
+
+
 @pytest.mark.asyncio
 async def test_tuberpy_async_context_with_exception(resolve):
     """Ensure exceptions in a sequence of calls show up as expected."""
@@ -585,13 +969,18 @@ async def test_tuberpy_warnings(resolve):
         r = await tuber_result(s.single_warning("This is a warning", error=True))
 
 
+def test_warnings_opt_out(tuber_call):
+    """Ensure objects can opt out of forwarding warnings"""
+    assert tuber_call(object="QuietWarnings", method="single_warning", args=["This is a warning"]) == Succeeded(True)
+
+
 @pytest.mark.asyncio
 async def test_tuberpy_resolve_all(resolve):
     """Ensure resolve finds all registry entries"""
     s = await resolve()
 
-    assert set(dir(s)) >= set(registry)
-    assert set(dir(s.Types)) >= set(dir(registry["Types"]))
+    assert s.tuber_names >= registry().keys()
+    assert set(dir(s.Types)) >= set(dir(registry()["Types"]))
 
 
 @pytest.mark.asyncio
@@ -676,9 +1065,9 @@ async def test_tuberpy_containers(resolve):
     assert len(s.ObjectListList) == 2
     assert len(s.ObjectListList[0]) == 1
     assert len(s.ObjectDict) == 2
-    assert list(s.ObjectDict.keys()) == ["a", "b"]
+    assert set(s.ObjectDict.keys()) == {"a", "b"}
     assert len(s.ObjectWithContainerProperties.property_objects) == 2
-    assert list(s.ObjectWithContainerProperties.method_objects.keys()) == ["a", "b"]
+    assert set(s.ObjectWithContainerProperties.method_objects.keys()) == {"a", "b"}
     assert s.ObjectWithContainerProperties.property_objects[0].PROPERTY == "expected property value"
     assert s.Container["a"].PROPERTY == "expected property value"
 
@@ -5,11 +5,13 @@ Tuber object interface
 from __future__ import annotations
 import asyncio
 import concurrent
+import os
 import textwrap
 import types
 import warnings
 import inspect
 import functools
+import math
 
 from . import TuberError, TuberStateError, TuberRemoteError
 from .codecs import AcceptTypes, Codecs, TuberResult
@@ -120,22 +122,45 @@ def resolve_simple(
     return instance
 
 
+# Attribute prefixes that are never treated as remote resources
+_BLACKLISTED_PREFIXES = (
+    "_sa",
+    "_ipython",
+    "_tuber",
+)
+
+
 def attribute_blacklisted(name: str):
     """
     Keep Python-specific attributes from being treated as potential remote
     resources. This blacklist covers SQLAlchemy, IPython, and Tuber internals.
     """
 
-    if name.startswith(
-        (
-            "_sa",
-            "_ipython",
-            "_tuber",
-        )
-    ):
-        return True
+    return name.startswith(_BLACKLISTED_PREFIXES)
 
-    return False
+
+@functools.lru_cache(maxsize=None)
+def _dedent(doc: str):
+    return textwrap.dedent(doc)
+
+
+# Signatures built from metadata, keyed by the repr() of their description.
+# Methods of the same class (or sharing a C++ signature) across many objects
+# then share a single Signature instance.
+_signatures = {}
+
+
+def _build_signature(sig: dict):
+    """Build an inspect.Signature from its metadata description."""
+    key = repr(sig)
+    try:
+        return _signatures[key]
+    except KeyError:
+        pass
+
+    params = [p if isinstance(p, inspect.Parameter) else inspect.Parameter(**p) for p in sig["parameters"]]
+    out = _signatures[key] = inspect.Signature(params, **{k: v for k, v in sig.items() if k != "parameters"})
+    return out
 
 
 def tuber_wrapper(func: callable, meta: dict):
@@ -145,19 +170,21 @@ def tuber_wrapper(func: callable, meta: dict):
 
     # Attach docstring, if provided and valid
     try:
-        func.__doc__ = textwrap.dedent(meta["__doc__"])
+        func.__doc__ = _dedent(meta["__doc__"])
     except:
         pass
 
     # Attach a function signature, if provided and valid
     try:
-        if isinstance(meta["__signature__"], str):
-            func.__text_signature__ = meta["__signature__"]
+        sig = meta["__signature__"]
+        if isinstance(sig, str):
+            func.__text_signature__ = sig
         else:
-            sig = meta["__signature__"]
-            if not isinstance(sig["parameters"][0], inspect.Parameter):
-                sig["parameters"] = [inspect.Parameter(**p) for p in sig["parameters"]]
-            func.__signature__ = inspect.Signature(**sig)
+            if not isinstance(sig, inspect.Signature):
+                # Keep the Signature in the metadata for any other wrapper
+                # built from the same description
+                sig = meta["__signature__"] = _build_signature(sig)
+            func.__signature__ = sig
     except:
         pass
 
@@ -200,21 +227,222 @@ def get_object_name(parent: str | list, attr: str | None = None, item: str | int
     return out
 
 
+def _has_non_finite(obj):
+    """Return True if a request payload contains any NaN or infinite floats."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if getattr(getattr(obj, "dtype", None), "kind", None) == "f":
+        # NumPy arrays and scalars
+        import numpy
+
+        return not numpy.isfinite(obj).all()
+    return False
+
+
+def _encode_request(calls):
+    """Serialize a batch of calls into a JSON request body (as bytes).
+
+    orjson is used where available, falling back to the standard library for
+    anything it refuses (e.g. integers beyond 64 bits).  orjson also encodes
+    NaN and infinities as null, so requests containing them are encoded by the
+    standard library, which preserves them.
+    """
+    if "orjson" in Codecs:
+        try:
+            out = Codecs["orjson"].encode(calls)
+        except TypeError:
+            pass
+        else:
+            # non-finite floats can only be present if null was written
+            if b"null" not in out or not _has_non_finite(calls):
+                return out
+    return Codecs["json"].encode(calls).encode("utf-8")
+
+
+_requests_session = None
+
+
+def _futures_session():
+    """Return the FuturesSession shared by all SimpleContexts, creating it on
+    first use.
+
+    Sharing one session across objects (and their children) lets every
+    serial request reuse the same pool of keep-alive connections.
+    """
+    global _requests_session
+    if _requests_session is None:
+        # hide import for non-library package that may not be invoked
+        from requests_futures.sessions import FuturesSession
+
+        _requests_session = FuturesSession()
+    return _requests_session
+
+
+_blocking_session = None
+
+
+def _sync_session():
+    """Return the requests Session used for blocking calls, creating it on
+    first use.
+
+    It shares its connection pool with the FuturesSession, but is only used
+    from the calling thread rather than from the FuturesSession executor.
+    """
+    global _blocking_session
+    if _blocking_session is None:
+        import requests
+
+        _blocking_session = requests.Session()
+        for prefix, adapter in _futures_session().adapters.items():
+            _blocking_session.mount(prefix, adapter)
+    return _blocking_session
+
+
+def _aiohttp_session(loop: asyncio.AbstractEventLoop):
+    """Return the aiohttp ClientSession attached to the given event loop,
+    creating it on first use.
+
+    The session is stored on the loop itself rather than in a weak mapping,
+    since the session holds a strong reference back to its loop.
+    """
+    try:
+        return loop._tuber_session
+    except AttributeError:
+        pass
+
+    # hide import for non-library package that may not be invoked
+    import aiohttp
+
+    # aiohttp.resolver.AsyncResolver does not support mDNS and is the
+    # DefaultResolver. Instead, we try to force the use of an
+    # MDNS-capable async resolver (if available) and use a threaded
+    # fallback that supports mDNS.
+    try:
+        from aiohttp_asyncmdnsresolver.api import AsyncMDNSResolver as Resolver
+    except ImportError:
+        Resolver = aiohttp.resolver.ThreadedResolver
+
+    # Monkey-patch tuber session memory handling with the running event loop
+    loop._tuber_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(resolver=Resolver()))
+
+    # Ensure that ClientSession.close() is called when the loop is
+    # closed.  ClientSession.__del__ does not close the session, so it
+    # is not sufficient to simply attach the session to the loop to
+    # ensure garbage collection.
+    loop_close = loop.close
+
+    def close(self):
+        if hasattr(self, "_tuber_session"):
+            if not self.is_closed():
+                self.run_until_complete(self._tuber_session.close())
+            del self._tuber_session
+        loop_close()
+
+    loop.close = types.MethodType(close, loop)
+
+    return loop._tuber_session
+
+
+# Window (in seconds) over which independently awaited method calls on async
+# TuberObjects are coalesced into a single request.  Disabled (0) by default;
+# set it here, or in microseconds via the TUBER_COALESCE_US environment variable.
+# Individual calls may opt out by passing tuber_no_coalesce=True, which is not
+# forwarded to the remote method.
+coalesce_window = float(os.environ.get("TUBER_COALESCE_US", 0)) * 1e-6
+
+# Open coalescing batches, keyed by event loop and connection settings
+_coalescing = {}
+_coalescing_tasks = set()
+
+
+def _coalesced_call(obj: "TuberObject", name: str, args: tuple, kwargs: dict):
+    """Queue a method call on a batch shared with other calls made within the
+    coalescing window, returning a future for its result."""
+
+    loop = asyncio.get_running_loop()
+    accept_types = obj._accept_types and tuple(obj._accept_types)
+    key = (loop, obj._tuber_host, accept_types, obj._convert_json, obj._timeout)
+
+    try:
+        ctx, returned = _coalescing[key]
+    except KeyError:
+        # Calls in the batch are unrelated, so an error in one must not cancel
+        # the others: each caller receives its own result or exception.
+        ctx = obj.tuber_context(return_exceptions=True)
+        returned = []
+        _coalescing[key] = (ctx, returned)
+        task = loop.create_task(_flush_coalesced(key, ctx, returned))
+        _coalescing_tasks.add(task)
+        task.add_done_callback(_coalescing_tasks.discard)
+
+    request = {"object": obj._tuber_objname, "method": name}
+    if args:
+        request["args"] = args
+    if kwargs:
+        request["kwargs"] = kwargs
+    future = ctx._add_call(**request)
+    if not obj._return_exceptions:
+        return future
+
+    # As for an uncoalesced call, errors from the server are returned rather
+    # than raised; the caller's future is resolved once the batch completes.
+    caller = loop.create_future()
+    returned.append((future, caller))
+    return caller
+
+
+async def _flush_coalesced(key: tuple, ctx: "Context", returned: list):
+    """Send a coalesced batch once its window has elapsed."""
+    await asyncio.sleep(coalesce_window)
+    del _coalescing[key]
+
+    futures = [f for _, f in ctx.calls] + [caller for _, caller in returned]
+    try:
+        await ctx()
+    except Exception as e:
+        # The request as a whole failed; report that to every caller
+        for f in futures:
+            if not f.done():
+                f.set_exception(e)
+        return
+
+    for future, caller in returned:
+        if not caller.done():
+            caller.set_result(future.exception() or future.result())
+
+
 class SubContext:
     """A container for attributes of a Context object"""
 
+    # One SubContext is created for every attribute or item reached through a
+    # context, so keep instances small.  Child attributes are cached in
+    # _tuber_attrs rather than in an instance __dict__.
+    __slots__ = ("objname", "attrname", "parent", "ctx_kwargs", "container", "_tuber_attrs")
+
     def __init__(self, objname: str, parent: "SimpleContext", attrname: str | None = None, **kwargs):
         self.objname = objname
         self.attrname = attrname
         self.parent = parent
         self.ctx_kwargs = kwargs
         self.container = {}
+        self._tuber_attrs = {}
 
     def __call__(self, *args, **kwargs):
         """method-like sub-context"""
         kwargs.update(self.parent.ctx_kwargs)
         kwargs.update(self.ctx_kwargs)
-        return self.parent._add_call(object=self.objname, method=self.attrname, args=args, kwargs=kwargs)
+
+        # Arguments are optional in the protocol, so leave out empty ones
+        request = {"object": self.objname, "method": self.attrname}
+        if args:
+            request["args"] = args
+        if kwargs:
+            request["kwargs"] = kwargs
+        return self.parent._add_call(**request)
 
     def __getitem__(self, item: str | int):
         """container-like sub-context"""
@@ -228,9 +456,13 @@ class SubContext:
         if attribute_blacklisted(name):
             raise AttributeError(f"{name} is not a valid method or property!")
 
+        try:
+            return self._tuber_attrs[name]
+        except KeyError:
+            pass
+
         objname = get_object_name(self.objname, attr=self.attrname)
-        caller = SubContext(objname, attrname=name, parent=self.parent)
-        setattr(self, name, caller)
+        caller = self._tuber_attrs[name] = SubContext(objname, attrname=name, parent=self.parent)
         return caller
 
 
@@ -249,6 +481,7 @@ class SimpleContext:
         convert_json: bool | None = None,
         return_exceptions: bool | None = None,
         timeout: float | None = None,
+        max_batch: int | None = None,
         **ctx_kwargs,
     ):
         """
@@ -257,7 +490,11 @@ class SimpleContext:
         obj : SimpleTuberObject
             Parent tuber object whose methods to call.
         accept_types : list of str
-            List of codecs that the client is able to decode.
+            List of codecs that the client is able to decode, in order of
+            preference.  Defaults to the object's accept types, or otherwise all
+            available codecs with CBOR (if installed) preferred.  Note that
+            NumPy arrays are returned as lists in JSON responses, but as
+            arrays in CBOR responses.
         convert_json : bool
             If True (default), all responses from the server should be converted into
             namespace objects by default.  This default may be overridden in the
@@ -269,6 +506,16 @@ class SimpleContext:
             individual context call.
         timeout : float
             HTTP request timeout in seconds.  If None, fall back to the object default.
+        max_batch : int
+            If given, automatically send queued calls to the server whenever this
+            many have accumulated, rather than holding them all until the context
+            is called.  Batches are sent in order, and results from every batch are
+            included in the list returned by the next context call.  Unless
+            ``return_exceptions`` is set for the context, a batch is not sent if
+            an earlier one failed, and its calls are cancelled.  Automatically
+            flushed batches always use the context's ``convert_json`` and
+            ``return_exceptions`` settings; arguments given when calling the
+            context only apply to calls that are still queued at that time.
         ctx_kwargs :
             Any remaining keyword arguments are added as additional keywords to any
             method call made by this context.
@@ -279,12 +526,15 @@ class SimpleContext:
         if accept_types is None:
             accept_types = self.obj._accept_types
         if accept_types is None:
-            self.accept_types = list(AcceptTypes.keys())
+            # Prefer CBOR where available: it is more compact and cheaper to
+            # decode than JSON, particularly for numeric arrays.
+            self.accept_types = sorted(AcceptTypes, key=lambda t: t != "application/cbor")
         else:
             for accept_type in accept_types:
                 if accept_type not in AcceptTypes.keys():
                     raise ValueError(f"Unsupported accept type: {accept_type}")
             self.accept_types = accept_types
+        self._accept_header = ", ".join(self.accept_types)
         if convert_json is None:
             convert_json = self.obj._convert_json
         self.convert_json = True if convert_json is None else convert_json
@@ -294,14 +544,16 @@ class SimpleContext:
         if timeout is None:
             timeout = self.obj._timeout
         self.timeout = timeout
+        self.max_batch = max_batch
         self.ctx_kwargs = ctx_kwargs
         self.container = {}
+        self._pending = []
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.calls:
+        if self.calls or self._pending:
             self()
 
     def __getitem__(self, item: str | int):
@@ -326,8 +578,28 @@ class SimpleContext:
     def _add_call(self, **request):
         future = concurrent.futures.Future()
         self.calls.append((request, future))
+        if self.max_batch is not None and len(self.calls) >= self.max_batch:
+            # Keep batches in order: wait for the previous one to complete
+            # (its result is collected later) before sending this one.
+            if self._pending:
+                previous = self._pending[-1]
+                concurrent.futures.wait([previous])
+                if not self.return_exceptions and (previous.cancelled() or previous.exception() is not None):
+                    # As within a batch, stop at the first error
+                    self._cancel()
+                    skipped = concurrent.futures.Future()
+                    skipped.cancel()
+                    self._pending.append(skipped)
+                    return future
+            self._pending.append(self.send())
         return future
 
+    def _cancel(self):
+        """Discard any queued calls, cancelling their futures."""
+        calls, self.calls = self.calls, []
+        for _, f in calls:
+            f.cancel()
+
     def send(self, convert_json: bool | None = None, return_exceptions: bool | None = None):
         """Break off a set of calls and return them for execution.
 
@@ -353,39 +625,37 @@ class SimpleContext:
         if not self.calls:
             return
 
-        calls = []
-        futures = []
-        while self.calls:
-            c, f = self.calls.pop(0)
+        futures, post_kwargs = self._prepare(return_exceptions)
+
+        # Hook function for parsing the response from the server
+        def hook(r, *args, **kwargs):
+            self._receive(r, futures, convert_json, return_exceptions)
+            return r
 
-            calls.append(c)
-            futures.append(f)
+        # Create a HTTP request to complete the call.
+        # Returns a Future whose result has been processed by the response hook.
+        return _futures_session().post(self.uri, hooks={"response": hook}, **post_kwargs)
 
-        if not hasattr(self.obj, "_tuber_session"):
-            # session object should persist beyond the lifetime of the context,
-            # akin to the asyncio event loop
-            from requests_futures.sessions import FuturesSession
+    def _prepare(self, return_exceptions: bool | None = None):
+        """Break off the queued calls, returning their futures and the keyword
+        arguments for the HTTP request that executes them."""
 
-            self.obj._tuber_session = FuturesSession()
+        pending, self.calls = self.calls, []
+        calls = [c for c, _ in pending]
+        futures = [f for _, f in pending]
 
-        cs = self.obj._tuber_session
+        if return_exceptions is None:
+            return_exceptions = self.return_exceptions
 
         # Declare the media types we want to allow getting back
-        headers = {"Accept": ", ".join(self.accept_types)}
+        headers = {"Accept": self._accept_header, "Content-Type": "application/json"}
         if return_exceptions:
             headers["X-Tuber-Options"] = "continue-on-error"
 
-        # Hook function for parsing the response from the server
-        def hook(r, *args, **kwargs):
-            self._receive(r, futures, convert_json, return_exceptions)
-            return r
-
-        # Create a HTTP request to complete the call.
-        # Returns a Future whose result has been processed by the response hook.
-        post_kwargs = dict(json=calls, headers=headers, hooks={"response": hook})
+        post_kwargs = dict(data=_encode_request(calls), headers=headers)
         if self.timeout is not None:
             post_kwargs["timeout"] = self.timeout
-        return cs.post(self.uri, **post_kwargs)
+        return futures, post_kwargs
 
     @staticmethod
     def _parse_json(json_out, futures: list, converted: bool, return_exceptions: bool):
@@ -415,21 +685,20 @@ class SimpleContext:
             ``return_exceptions`` is True, each response may be a ``TuberRemoteError``
             object, rather than a namespace object (if ``converted`` is True) or a dict.
         """
+        # Look up response fields through a plain dict, whether or not the
+        # response was converted to namespace objects
         if converted:
-            haskey = hasattr
 
-            def getkey(d, *k):
-                return functools.reduce(lambda d, k: getattr(d, k), k, d)
+            def fields(d):
+                return vars(d) if isinstance(d, TuberResult) else {}
 
         else:
 
-            def haskey(d, k):
-                return isinstance(d, dict) and k in d
+            def fields(d):
+                return d if isinstance(d, dict) else {}
 
-            def getkey(d, *k):
-                return functools.reduce(lambda d, k: d[k], k, d)
-
-        if haskey(json_out, "error"):
+        top = fields(json_out)
+        if "error" in top:
             # Oops - this is actually a server-side error that bubbles
             # through. (See test_tuberpy_async_context_with_unserializable.)
             # We made an array request, and received an object response
@@ -437,38 +706,48 @@ class SimpleContext:
             # best we can.
             for f in futures:
                 f.cancel()
-            raise TuberRemoteError(getkey(json_out, "error", "message"))
+            raise TuberRemoteError(fields(top["error"])["message"])
 
+        # Build the list of results alongside the futures, rather than reading
+        # each future back afterwards
+        out = []
+        failed = []
         for f, r in zip(futures, json_out):
+            r = fields(r)
+
             # Always emit warnings, if any occurred
-            if haskey(r, "warnings") and getkey(r, "warnings"):
-                for w in getkey(r, "warnings"):
+            if ws := r.get("warnings"):
+                for w in ws:
                     warnings.warn(w)
 
             # Resolve either a result or an error
-            if haskey(r, "error") and getkey(r, "error"):
-                err = getkey(r, "error")
-                if haskey(err, "message"):
-                    f.set_exception(TuberRemoteError(getkey(err, "message")))
+            if err := r.get("error"):
+                err = fields(err)
+                if "message" in err:
+                    result = TuberRemoteError(err["message"])
                 else:
-                    f.set_exception(TuberRemoteError("Unknown error"))
+                    result = TuberRemoteError("Unknown error")
+            elif "result" in r:
+                result = r["result"]
             else:
-                if haskey(r, "result"):
-                    f.set_result(getkey(r, "result"))
-                else:
-                    f.set_exception(TuberError("Result has no 'result' attribute"))
+                result = TuberError("Result has no 'result' attribute")
 
-        # Return a list of results
-        if return_exceptions:
-            out = []
-            for f in futures:
-                try:
-                    out.append(f.result())
-                except Exception as e:
-                    out.append(e)
-            return out
+            if isinstance(result, TuberError):
+                f.set_exception(result)
+                failed.append(f)
+            else:
+                f.set_result(result)
+            out.append(result)
+
+        # Exceptions are either returned or raised here, so mark them as
+        # retrieved (asyncio otherwise complains about them on cleanup).
+        for f in failed:
+            f.exception()
 
-        return [f.result() for f in futures]
+        if failed and not return_exceptions:
+            raise failed[0].exception()
+
+        return out
 
     def _receive(
         self,
@@ -523,7 +802,7 @@ class SimpleContext:
             # this is slightly more liberal than checking that it is really among those we declared
             if content_type not in AcceptTypes:
                 raise TuberError(f"Unexpected response content type: {content_type}")
-            json_out = AcceptTypes[content_type](raw_out, resp.apparent_encoding, convert=convert_json)
+            json_out = AcceptTypes[content_type](raw_out, resp.encoding or "utf-8", convert=convert_json)
 
         response.tuber_results = self._parse_json(json_out, futures, convert_json, return_exceptions)
         return response.tuber_results
@@ -565,8 +844,24 @@ class SimpleContext:
             List of responses from the server, corresponding to each of the requested
             calls.
         """
-        resp = self.send(convert_json=convert_json, return_exceptions=return_exceptions)
-        return self.receive(resp)
+        pending, self._pending = self._pending, []
+        results = []
+        try:
+            for r in pending:
+                results.extend(self.receive(r))
+        except BaseException:
+            # Calls queued behind a failed batch are never sent
+            self._cancel()
+            raise
+
+        if not self.calls:
+            return results
+
+        # We're about to block on the response anyway, so make the request on
+        # this thread rather than handing it to the FuturesSession executor.
+        futures, post_kwargs = self._prepare(return_exceptions)
+        resp = _sync_session().post(self.uri, **post_kwargs)
+        return results + self._receive(resp, futures, convert_json, return_exceptions)
 
 
 class Context(SimpleContext):
@@ -582,7 +877,7 @@ class Context(SimpleContext):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Ensure the context is flushed."""
-        if self.calls:
+        if self.calls or self._pending:
             await self()
 
     def __enter__(self):
@@ -595,8 +890,25 @@ class Context(SimpleContext):
         loop = asyncio.get_running_loop()
         future = loop.create_future()
         self.calls.append((request, future))
+        if self.max_batch is not None and len(self.calls) >= self.max_batch:
+            calls, self.calls = self.calls, []
+            previous = self._pending[-1] if self._pending else None
+            self._pending.append(loop.create_task(self._flush(calls, previous)))
         return future
 
+    async def _flush(self, calls: list, previous: asyncio.Task | None):
+        """Send an automatically flushed batch once the previous one (if any)
+        has completed, so that batches reach the server in order.  The batch
+        is cancelled instead if the previous one failed."""
+        if previous is not None:
+            await asyncio.wait([previous])
+            if not self.return_exceptions and (previous.cancelled() or previous.exception() is not None):
+                # As within a batch, stop at the first error
+                for _, f in calls:
+                    f.cancel()
+                raise asyncio.CancelledError
+        return await self._dispatch(calls)
+
     async def __call__(self, convert_json: bool | None = None, return_exceptions: bool | None = None):
         """Break off a set of calls and return them for execution.
 
@@ -618,54 +930,32 @@ class Context(SimpleContext):
             calls.
         """
 
-        # An empty Context returns an empty list of calls
-        if not self.calls:
-            return []
-
-        calls = []
-        futures = []
-        while self.calls:
-            c, f = self.calls.pop(0)
-
-            calls.append(c)
-            futures.append(f)
+        # Collect any batches that were flushed automatically
+        results = []
+        if self._pending:
+            pending, self._pending = self._pending, []
+            for r in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(r, BaseException):
+                    # Calls queued behind a failed batch are never sent
+                    self._cancel()
+                    raise r
+                results.extend(r)
 
-        loop = asyncio.get_running_loop()
-        # hide import for non-library package that may not be invoked
-        import aiohttp
+        calls, self.calls = self.calls, []
+        return results + await self._dispatch(calls, convert_json, return_exceptions)
 
-        if not hasattr(loop, "_tuber_session"):
+    async def _dispatch(self, calls: list, convert_json: bool | None = None, return_exceptions: bool | None = None):
+        """Send a list of (request, future) pairs to the server and return the
+        parsed responses."""
 
-            # aiohttp.resolver.AsyncResolver does not support mDNS and is the
-            # DefaultResolver. Instead, we try to force the use of an
-            # MDNS-capable async resolver (if available) and use a threaded
-            # fallback that supports mDNS.
-            try:
-                from aiohttp_asyncmdnsresolver.api import AsyncMDNSResolver as Resolver
-            except ImportError:
-                Resolver = aiohttp.resolver.ThreadedResolver
-
-            # Monkey-patch tuber session memory handling with the running event loop
-            loop._tuber_session = aiohttp.ClientSession(
-                json_serialize=Codecs["json"].encode, connector=aiohttp.TCPConnector(resolver=Resolver())
-            )
-
-            # Ensure that ClientSession.close() is called when the loop is
-            # closed.  ClientSession.__del__ does not close the session, so it
-            # is not sufficient to simply attach the session to the loop to
-            # ensure garbage collection.
-            loop_close = loop.close
-
-            def close(self):
-                if hasattr(self, "_tuber_session"):
-                    if not self.is_closed():
-                        self.run_until_complete(self._tuber_session.close())
-                    del self._tuber_session
-                loop_close()
+        # An empty Context returns an empty list of calls
+        if not calls:
+            return []
 
-            loop.close = types.MethodType(close, loop)
+        futures = [f for _, f in calls]
+        calls = [c for c, _ in calls]
 
-        cs = loop._tuber_session
+        cs = _aiohttp_session(asyncio.get_running_loop())
 
         if convert_json is None:
             convert_json = self.convert_json
@@ -673,14 +963,16 @@ class Context(SimpleContext):
             return_exceptions = self.return_exceptions
 
         # Declare the media types we want to allow getting back
-        headers = {"Accept": ", ".join(self.accept_types)}
+        headers = {"Accept": self._accept_header, "Content-Type": "application/json"}
         if return_exceptions:
             headers["X-Tuber-Options"] = "continue-on-error"
         # Create a HTTP request to complete the call. This is a coroutine,
         # so we queue the call and then suspend execution (via 'yield')
         # until it's complete.
-        post_kwargs = dict(json=calls, headers=headers)
+        post_kwargs = dict(data=_encode_request(calls), headers=headers)
         if self.timeout is not None:
+            import aiohttp
+
             post_kwargs["timeout"] = aiohttp.ClientTimeout(total=self.timeout)
         async with cs.post(self.uri, **post_kwargs) as resp:
             raw_out = await resp.read()
@@ -712,6 +1004,7 @@ class SimpleTuberObject:
 
     _context_class = SimpleContext
     _tuber_objname = None
+    _tuber_names = frozenset()
 
     def __init__(
         self,
@@ -784,11 +1077,21 @@ class SimpleTuberObject:
         if self._tuber_resolved:
             return hasattr(self, "_items")
 
+    @property
+    def tuber_names(self):
+        """Frozen set of remote object, method and property names exposed by
+        this object once resolved.  Membership tests against this set are
+        cheaper than searching dir()."""
+        return self._tuber_names
+
     def __repr__(self):
         return f"{self.__class__.__name__}({self._tuber_objname!r}, hostname={self._tuber_host!r})"
 
     def __getattr__(self, name: str):
-        # Useful hint
+        # Useful hint, unless the object has already been resolved. (Look in
+        # __dict__ directly, so a partially-constructed object can't recurse.)
+        if self.__dict__.get("_tuber_resolved"):
+            raise AttributeError(f"'{self._tuber_objname}' has no attribute '{name}'")
         raise AttributeError(f"'{self._tuber_objname}' has no attribute '{name}'.  Did you run tuber_resolve()?")
 
     def __len__(self):
@@ -821,6 +1124,21 @@ class SimpleTuberObject:
 
         return self._context_class(self, **kwargs)
 
+    def tuber_map(self, name: str, *iterables, **kwargs):
+        """Call a remote method once for each set of arguments, using a single
+        batched request.
+
+        Positional arguments for each call are drawn from ``iterables``, as for
+        the built-in ``map()``.  Any keyword arguments are passed to
+        ``tuber_context()``, and so either configure the context or are added to
+        every call.  Returns a list of results, one per call.
+        """
+        with self.tuber_context(**kwargs) as ctx:
+            method = getattr(ctx, name)
+            for args in zip(*iterables):
+                method(*args)
+            return ctx()
+
     def tuber_resolve(self, force: bool = False):
         """Retrieve metadata associated with the remote network resource.
 
@@ -969,6 +1287,7 @@ class SimpleTuberObject:
 
             setattr(self, "tuber_get", types.MethodType(tuber_get, self))
 
+        self._tuber_names = frozenset(objects).union(methods, properties)
         self._tuber_resolved = True
         return meta
 
@@ -1001,11 +1320,29 @@ class TuberObject(SimpleTuberObject):
 
         self._resolve_meta(meta)
 
+    async def tuber_map(self, name: str, *iterables, **kwargs):
+        """Call a remote method once for each set of arguments, using a single
+        batched request.
+
+        Positional arguments for each call are drawn from ``iterables``, as for
+        the built-in ``map()``.  Any keyword arguments are passed to
+        ``tuber_context()``, and so either configure the context or are added to
+        every call.  Returns a list of results, one per call.
+        """
+        async with self.tuber_context(**kwargs) as ctx:
+            method = getattr(ctx, name)
+            for args in zip(*iterables):
+                method(*args)
+            return await ctx()
+
     @staticmethod
     def _resolve_method(name: str, meta: dict):
         """Resolve a remote method call into an async callable function"""
 
-        async def invoke(self, *args, **kwargs):
+        async def invoke(self, *args, tuber_no_coalesce=False, **kwargs):
+            if coalesce_window and not tuber_no_coalesce:
+                return await _coalesced_call(self, name, args, kwargs)
+
             async with self.tuber_context() as ctx:
                 getattr(ctx, name)(*args, **kwargs)
                 results = await ctx()
@@ -1,5 +1,6 @@
 from collections.abc import Sequence, Mapping
 from collections import namedtuple
+import array
 import sys
 import types
 
@@ -54,35 +55,60 @@ def wrap_bytes_for_json(obj):
     if isinstance(obj, bytes):
         data = [int(v) for v in obj]
         return {"bytes": data}
+    if isinstance(obj, array.array):
+        return obj.tolist()
+    if have_numpy and isinstance(obj, (numpy.ndarray, numpy.generic)):
+        return obj.tolist()
     return obj
 
 
+# CBOR typed array tags (RFC 8746), by element kind and size. These are the big endian tags; add 4
+# for little endian data if the element size is larger than one byte.
+_cbor_typed_array_tags = {
+    "u": {
+        1: 64,
+        2: 65,
+        4: 66,
+        8: 67,
+    },
+    "i": {
+        1: 72,
+        2: 73,
+        4: 74,
+        8: 75,
+    },
+    "f": {
+        2: 80,
+        4: 81,
+        8: 82,
+        16: 83,
+    },
+}
+
+# Element kinds for array.array type codes
+_array_typecode_kinds = {
+    "b": "i",
+    "h": "i",
+    "i": "i",
+    "l": "i",
+    "q": "i",
+    "B": "u",
+    "H": "u",
+    "I": "u",
+    "L": "u",
+    "Q": "u",
+    "f": "f",
+    "d": "f",
+}
+
+
 def cbor_encode_ndarray(enc, arr):
     # At the moment, this handles only contiguous arrays of data types which can be represented
     # as CBOR typed arrays, as these can be handled with a singleblock copy of the underlying data,
     # with no per-element handling.
 
     # start with big endian tags, and then patch up later if the data turn out to be little endian
-    type_tags = {
-        "u": {
-            1: 64,
-            2: 65,
-            4: 66,
-            8: 67,
-        },
-        "i": {
-            1: 72,
-            2: 73,
-            4: 74,
-            8: 75,
-        },
-        "f": {
-            2: 80,
-            4: 81,
-            8: 82,
-            16: 83,
-        },
-    }
+    type_tags = _cbor_typed_array_tags
     if arr.dtype.kind not in type_tags or arr.dtype.itemsize not in type_tags[arr.dtype.kind]:
         raise cbor2.CBOREncodeTypeError(
             f"Serialization of numpy arrays with element type {arr.dtype} is not implemented"
@@ -113,10 +139,28 @@ def cbor_encode_ndarray(enc, arr):
     enc.write(arr.tobytes())
 
 
+def cbor_encode_array(enc, arr):
+    # array.array objects are one-dimensional, contiguous, and stored in native byte order, so they
+    # map directly onto a single CBOR typed array.
+    kind = _array_typecode_kinds.get(arr.typecode)
+    if kind is None or arr.itemsize not in _cbor_typed_array_tags[kind]:
+        raise cbor2.CBOREncodeTypeError(f"Serialization of arrays with type code {arr.typecode!r} is not implemented")
+    type_tag = _cbor_typed_array_tags[kind][arr.itemsize]
+    if arr.itemsize > 1 and sys.byteorder == "little":
+        type_tag += 4
+
+    enc.encode_length(6, type_tag)
+    enc.encode_length(2, len(arr) * arr.itemsize)
+    enc.write(arr.tobytes())
+
+
 def cbor_augment_encode(enc, obj):
-    if isinstance(obj, numpy.ndarray):
+    if have_numpy and isinstance(obj, numpy.ndarray):
         cbor_encode_ndarray(enc, obj)
         return
+    if isinstance(obj, array.array):
+        cbor_encode_array(enc, obj)
+        return
     raise cbor2.CBOREncodeTypeError(f"Unsupported object for CBOR encoding {type(obj)}")
 
 
@@ -194,8 +238,11 @@ if have_orjson:
         return orjson.loads(response_data, **kwargs)
 
     def encode_orjson(obj, **kwargs):
+        # Allow non-string dictionary keys, which json.dumps() also accepts
+        option = kwargs.get("option", 0) | orjson.OPT_NON_STR_KEYS
         if have_numpy:
-            kwargs["option"] = kwargs.get("option", 0) | orjson.OPT_SERIALIZE_NUMPY
+            option |= orjson.OPT_SERIALIZE_NUMPY
+        kwargs["option"] = option
         return orjson.dumps(obj, default=wrap_bytes_for_json, **kwargs)
 
     Codecs["orjson"] = Codec(decode=decode_orjson, encode=encode_orjson)
@@ -209,10 +256,14 @@ def decode_json_client(response_data, encoding, convert=True):
         if isinstance(obj, Mapping) and "bytes" in obj and (len(obj) == 1 or (len(obj) == 2 and "subtype" in obj)):
             try:
                 return bytes(obj["bytes"])
-            except e as ValueError:
+            except ValueError:
                 pass
         return TuberResult(**obj) if convert else obj
 
+    # json.loads() accepts UTF-8 bytes directly, so skip the intermediate str
+    # for the overwhelmingly common case. Other charsets still need decoding.
+    if encoding.lower() in ("utf-8", "utf8", "ascii", "us-ascii"):
+        return decode_json(response_data, object_hook=ohook)
     return decode_json(response_data.decode(encoding), object_hook=ohook)
 
 
@@ -222,13 +273,20 @@ AcceptTypes["application/json"] = decode_json_client
 # Use cbor2 to handle CBOR, if available
 if have_cbor:
 
+    def cbor_tuber_result(data):
+        # Unlike JSON, CBOR maps may have non-string keys, which can't be
+        # namespace attributes. Convert them as a JSON encoder would.
+        if not all(isinstance(k, str) for k in data):
+            data = {k if isinstance(k, str) else json.dumps(k): v for k, v in data.items()}
+        return TuberResult(**data)
+
     # Adapt the (tag,) -> value tag handler to the version-specific tag_hook signature.
     if _CBOR2_V6:
         _tag_hook = lambda tag, immutable: cbor_tag_decode(tag)
-        _obj_hook_convert = lambda data, immutable: TuberResult(**data)
+        _obj_hook_convert = lambda data, immutable: cbor_tuber_result(data)
     else:
         _tag_hook = lambda dec, tag: cbor_tag_decode(tag)
-        _obj_hook_convert = lambda dec, data: TuberResult(**data)
+        _obj_hook_convert = lambda dec, data: cbor_tuber_result(data)
 
     def decode_cbor(response_data, **kwargs):
         return cbor2.loads(response_data, tag_hook=_tag_hook, **kwargs)
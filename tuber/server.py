@@ -2,11 +2,13 @@ from __future__ import annotations
 
 
 import inspect
+import operator
 import os
 import warnings
 import functools
 import sys
 import traceback
+import types
 
 from .codecs import Codecs
 from . import schema
@@ -33,17 +35,111 @@ def error_response(message):
     return {"error": {"message": message}}
 
 
+# Response for requests skipped after an earlier error in the same batch.  This
+# is shared between all such requests, and must not be modified.
+_EARLY_BAIL_ERROR = error_response("Something went wrong in a preceding call")
+
+# Defaults for calls without "args" or "kwargs".  These are only ever unpacked
+# into method calls, never modified.
+_NO_ARGS = []
+_NO_KWARGS = {}
+
+
+# Header values are drawn from a handful of distinct strings in practice, so
+# their parsed forms are cached.
+@functools.lru_cache(maxsize=64)
+def negotiate(content_type, accept, formats):
+    """
+    Return the request and response formats for the given Content-Type and
+    Accept headers, choosing from the given formats.
+
+    The response format matches the request unless the Accept header (if any)
+    says otherwise, and is None if none of the formats are acceptable.  Raises
+    ValueError if the request format is not supported.
+    """
+    if content_type not in formats:
+        raise ValueError(f"Not able to decode media type {content_type}")
+
+    if accept is None:
+        return content_type, content_type
+
+    accept_types = [v.strip() for v in accept.split(",")]
+    if "*/*" in accept_types or "application/*" in accept_types:
+        return content_type, content_type
+    for t in accept_types:
+        if t in formats:
+            return content_type, t
+    return content_type, None
+
+
+@functools.lru_cache(maxsize=64)
+def parse_options(options):
+    """
+    Return the set of options given in an X-Tuber-Options header.
+    """
+    return frozenset(v.strip() for v in options.split(","))
+
+
+def call_method(method, args, kwargs):
+    """
+    Call a method and return a result or error response.
+    """
+    try:
+        return result_response(method(*args, **kwargs))
+    except Exception:
+        # exclude this frame from exception traceback
+        t, v, tb = sys.exc_info()
+        message = "".join(traceback.format_exception(t, v, tb.tb_next))
+        return error_response(message)
+
+
 def resolve_method(method, bound=True):
     """
     Return a description of a method.
+
+    Signatures of bound Python methods depend only on the underlying function,
+    so they are cached by function.  Such signature descriptions are shared
+    and must not be modified by the caller.
     """
+    if isinstance(method, types.MethodType) and isinstance(method.__func__, types.FunctionType):
+        # docstrings may be inherited through the class of the bound instance,
+        # so only the signature is cached
+        out = dict(__doc__=inspect.getdoc(method))
+        sig = resolve_bound_signature(method.__func__, bound)
+        if sig is not None:
+            out["__signature__"] = sig
+        return out
+    return _resolve_method(method, bound)
 
+
+@functools.lru_cache(maxsize=8192)
+def resolve_bound_signature(func, bound):
+    """
+    Return a description of the signature of a Python function bound to an
+    instance, or None if it has no usable signature.
+    """
+    # the signature of a bound method does not depend on what it is bound to
+    return _resolve_method(types.MethodType(func, object()), bound).get("__signature__")
+
+
+def _resolve_method(method, bound):
     doc = inspect.getdoc(method)
     sig = None
 
-    try:
-        sig = inspect.signature(method)
-    except:
+    # C-extension callables without a text signature (e.g. pybind methods)
+    # cannot be inspected, so go straight to the docstring for those
+    if (
+        type(method).__name__ not in ("builtin_function_or_method", "method", "instancemethod")
+        or hasattr(method, "__code__")
+        or getattr(method, "__text_signature__", None) is not None
+        or hasattr(method, "__signature__")
+    ):
+        try:
+            sig = inspect.signature(method)
+        except:
+            pass
+
+    if sig is None:
         # pybind docstrings include a signature as the first line
         if doc and doc.startswith(method.__name__ + "("):
             if "\n" in doc:
@@ -98,6 +194,77 @@ def resolve_method(method, bound=True):
     return out
 
 
+@functools.lru_cache(maxsize=8192)
+def resolve_class_method(cls, name):
+    """
+    Return a description of a method defined on a class.
+
+    Such descriptions depend only on the class and not on any instance, so
+    they are cached to avoid repeated signature parsing.  Methods replaced on
+    the class after they were first described are not picked up.
+    """
+    return resolve_method(getattr(cls, name), bound=False)
+
+
+@functools.lru_cache(maxsize=1024)
+def class_attribute_names(cls):
+    """
+    Return the attribute names defined by a class and its bases, excluding
+    those of ``object`` itself, which are never exported.  The result is
+    cached per class, so attributes added to the class later are not seen.
+    """
+    names = set()
+    for klass in cls.__mro__:
+        if klass is object:
+            break
+        names.update(klass.__dict__)
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=1024)
+def class_function_names(cls):
+    """
+    Return the names of plain Python functions defined by a class and its
+    bases.  On instances of the class, these are known to be methods without
+    having to look them up (and bind them) on each instance.  As with
+    class_attribute_names(), later changes to the class are not seen.
+    """
+    if cls.__getattribute__ is not object.__getattribute__:
+        return frozenset()
+    return frozenset(
+        d for d in class_attribute_names(cls) if isinstance(inspect.getattr_static(cls, d), types.FunctionType)
+    )
+
+
+def attribute_names(obj):
+    """
+    Return the sorted attribute names of an object, as dir() would.
+
+    For ordinary instances, this combines the (cached) names from the class
+    hierarchy with those in the instance dictionary.
+    """
+    cls = type(obj)
+    if cls.__dir__ is not object.__dir__ or isinstance(obj, type):
+        return dir(obj)
+
+    names = class_attribute_names(cls)
+    instance_names = getattr(obj, "__dict__", None)
+    if instance_names:
+        names = names.union(instance_names)
+    return sorted(names)
+
+
+def is_tuber_object(obj):
+    """
+    Return True if the given object should be described as a nested tuber
+    object (e.g. a TuberContainer) rather than as a method or property.
+
+    The marker is looked up on the type, which avoids falling through to any
+    __getattr__ the object itself defines.
+    """
+    return getattr(type(obj), "__tuber_object__", False)
+
+
 def check_attribute(obj, d):
     """
     Return True if the given attribute is safe to resolve, False otherwise.
@@ -136,27 +303,37 @@ def resolve_object(obj, recursive=True):
 
     out = dict(__doc__=inspect.getdoc(obj), methods=methods, properties=props)
 
-    for d in dir(obj):
+    cls = type(obj)
+    functions = class_function_names(cls)
+    instance_names = getattr(obj, "__dict__", None) or ()
+
+    for d in attribute_names(obj):
         # Don't export dunder methods or attributes - this avoids exporting
         # Python internals on the server side to any client.
         if not check_attribute(obj, d):
             continue
+
+        # Methods defined as plain functions on the class need not be bound
+        if d in functions and d not in instance_names:
+            if recursive:
+                methods[d] = resolve_class_method(cls, d)
+            else:
+                methods.append(d)
+            continue
+
         attr = getattr(obj, d)
         if recursive:
-            if getattr(attr, "__tuber_object__", False):
+            if is_tuber_object(attr):
                 objects[d] = resolve_object(attr)
             elif callable(attr):
-                bound = True
-                try:
-                    attr = getattr(obj.__class__, d)
-                    bound = False
-                except AttributeError:
-                    pass
-                methods[d] = resolve_method(attr, bound=bound)
+                if hasattr(obj.__class__, d):
+                    methods[d] = resolve_class_method(obj.__class__, d)
+                else:
+                    methods[d] = resolve_method(attr)
             else:
                 props[d] = attr
         else:
-            if getattr(attr, "__tuber_object__", False):
+            if is_tuber_object(attr):
                 # ignore nested objects when not recursing
                 continue
             if callable(attr):
@@ -176,9 +353,48 @@ def resolve_object(obj, recursive=True):
     return out
 
 
+def compile_validator(schema_type):
+    """
+    Return a function that validates data against the given schema.
+
+    fastjsonschema is used if available, since it generates code specialized
+    to the schema.  Otherwise, a reusable jsonschema validator is built.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        pass
+    else:
+        return fastjsonschema.compile(schema_type)
+
+    import jsonschema
+
+    cls = jsonschema.validators.validator_for(schema_type)
+    cls.check_schema(schema_type)
+    validator = cls(schema_type)
+
+    def validate(data):
+        error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+        if error is not None:
+            raise error
+
+    return validate
+
+
+def object_key(objname):
+    """
+    Return a hashable key for an object name, which may be a string or a
+    (decoded) list path.  Raises TypeError for names that cannot be keyed.
+    """
+    if isinstance(objname, str):
+        return objname
+    return tuple(x if isinstance(x, str) else tuple(x) for x in objname)
+
+
 class TuberContainer:
     """Container for grouping objects"""
 
+    __slots__ = ("_items",)
     __tuber_object__ = True
     __tuber_exclude__ = ["_items"]
 
@@ -211,7 +427,8 @@ class TuberContainer:
             else:
                 keys = self.keys()
 
-        return [getattr(self[k], method)(*args, **kwargs) for k in keys]
+        call = operator.methodcaller(method, *args, **kwargs)
+        return list(map(call, map(self._items.__getitem__, keys)))
 
     def tuber_meta(self):
         """
@@ -232,6 +449,9 @@ class TuberContainer:
         return out
 
     def __getattr__(self, name):
+        # special names are never forwarded to the underlying items
+        if name.startswith("__"):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
         return getattr(self._items, name)
 
     def __len__(self):
@@ -247,6 +467,8 @@ class TuberContainer:
 class TuberArray(TuberContainer):
     """Container for grouping identical objects"""
 
+    __slots__ = ()
+
     def __init__(self, items):
         super().__init__(items)
 
@@ -255,9 +477,11 @@ class TuberArray(TuberContainer):
         else:
             values = list(self._items.values())
 
+        # Items may be instances of subclasses of the first item's type, so
+        # only fall back to a per-item check when the types are not identical.
         tp = type(values[0])
-        for v in values:
-            if not isinstance(v, tp):
+        if len(set(map(type, values))) != 1:
+            if not all(isinstance(v, tp) for v in values):
                 raise TypeError("Array items must have the same type")
 
     def tuber_meta(self):
@@ -280,6 +504,8 @@ class TuberRegistry:
     Registry class.
     """
 
+    __slots__ = ("_entries", "_version")
+
     def __init__(self, registry: dict | None = None, **kwargs):
         """
         Construct a TuberRegistry containing object references (perhaps in a
@@ -301,6 +527,9 @@ class TuberRegistry:
         The two approaches are equivalent.
         """
 
+        self._entries = {}
+        self._version = 0
+
         if registry:
             for k, v in registry.items():
                 setattr(self, k, v)
@@ -308,8 +537,24 @@ class TuberRegistry:
         for k, v in kwargs.items():
             setattr(self, k, v)
 
+    def __getattr__(self, name):
+        if name in self.__slots__:
+            raise AttributeError(name)
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+
+    def __setattr__(self, name, value):
+        if name in self.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            self._entries[name] = value
+            # let request handlers know that their cached lookups are stale
+            object.__setattr__(self, "_version", self._version + 1)
+
     def __iter__(self):
-        return iter(self.__dict__)
+        return iter(self._entries)
 
     def __getitem__(self, objname):
         """
@@ -336,15 +581,23 @@ class TuberRegistry:
         try:
             # simple object
             if isinstance(objname, str):
-                return getattr(self, objname)
-
-            # object traversal
-            objname = [[x] if isinstance(x, str) else x for x in objname]
-
-            def agetter(obj, attr, *items):
-                return functools.reduce(lambda o, i: o[i], items, getattr(obj, attr))
-
-            return functools.reduce(lambda obj, x: agetter(obj, *x), objname, self)
+                try:
+                    return self._entries[objname]
+                except KeyError:
+                    return getattr(self, objname)
+
+            # object traversal: each path element is either an attribute name,
+            # or a sequence of an attribute name followed by item indices
+            obj = self
+            for x in objname:
+                if isinstance(x, str):
+                    obj = getattr(obj, x)
+                    continue
+                attr, *items = x
+                obj = getattr(obj, attr)
+                for item in items:
+                    obj = obj[item]
+            return obj
 
         except Exception as e:
             raise e.__class__(f"{str(e)} (Invalid object name '{objname}')")
@@ -355,7 +608,9 @@ class RequestHandler:
     Tuber server request handler.
     """
 
-    def __init__(self, registry, json_module="json", default_format="application/json", validate=False):
+    def __init__(
+        self, registry, json_module="json", default_format="application/json", validate=False, capture_warnings=True
+    ):
         """
         Arguments
         ---------
@@ -364,10 +619,16 @@ class RequestHandler:
             or a user-created TuberRegistry object.
         json_module : str
             Python package to use for encoding and decoding JSON requests.
+            orjson is faster, but encodes NaN and infinities as null and does
+            not handle integers beyond 64 bits.
         default_format : str
             Default encoding format to assume for requests and responses.
         validate : bool
             If True, validate incoming and outgoing packets with jsonschema.
+        capture_warnings : bool
+            If True, forward warnings raised by method calls to the client.
+            Individual objects may opt out by setting a
+            ``__tuber_record_warnings__`` attribute to False.
         """
         # ensure registry is a dictionary
         assert isinstance(registry, (dict, TuberRegistry)), "Invalid registry"
@@ -375,6 +636,11 @@ class RequestHandler:
             registry = TuberRegistry(registry)
         self.registry = registry
 
+        # cache of registry lookups, keyed by object name, and valid for a
+        # single version of the registry
+        self._objects = {}
+        self._version = registry._version
+
         # populate codecs
         self.codecs = {}
 
@@ -391,6 +657,63 @@ class RequestHandler:
         assert default_format in self.codecs, f"Missing codec for {default_format}"
         self.default_format = default_format
         self._validate = validate
+        self._capture_warnings = capture_warnings
+        self._validators = {}
+
+        self._formats = tuple(self.codecs)
+
+        # bind codec functions once, rather than on every request
+        self._encoders = {fmt: codec.encode for fmt, codec in self.codecs.items()}
+        self._decoders = {fmt: codec.decode for fmt, codec in self.codecs.items()}
+
+    def check_registry(self):
+        """
+        Discard cached lookups if the registry has been modified since they
+        were made.
+        """
+        if self.registry._version != self._version:
+            self._objects.clear()
+            self._version = self.registry._version
+
+    def lookup(self, objname):
+        """
+        Return the registry object for the given name.
+
+        Registry entries are cached until the registry is next modified.
+        Anything reached through their attributes or items may change without
+        the registry knowing, so such paths are traversed on every lookup.
+        """
+        self.check_registry()
+        try:
+            key = object_key(objname)
+            return self._objects[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # malformed or unhashable object name; let the registry complain
+            return self.registry[objname]
+
+        obj = self.registry[objname]
+        name = key if isinstance(key, str) else key[0] if len(key) == 1 else None
+        if isinstance(name, str) and name in self.registry._entries:
+            self._objects[key] = obj
+        return obj
+
+    def lookup_method(self, objname, methodname):
+        """
+        Return a method of a registry object, and whether warnings raised by
+        the method should be forwarded to the client.
+
+        Only the object lookup is cached.  The method itself is fetched on
+        every call, so that methods replaced on the object or its class (e.g.
+        when patched in tests) take effect immediately.
+        """
+        obj = self.lookup(objname)
+
+        # objects may opt out of forwarding warnings to the client
+        record = self._capture_warnings and getattr(obj, "__tuber_record_warnings__", True)
+
+        return getattr(obj, methodname), record
 
     def validate(self, data, schema_type):
         """
@@ -401,11 +724,17 @@ class RequestHandler:
         if not self._validate:
             return
 
-        import jsonschema
-
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            jsonschema.validate(data, schema_type)
+
+            # Validators are built once per schema
+            try:
+                _, validator = self._validators[id(schema_type)]
+            except KeyError:
+                validator = compile_validator(schema_type)
+                self._validators[id(schema_type)] = (schema_type, validator)
+
+            validator(data)
 
     def encode(self, data, fmt=None):
         """
@@ -415,11 +744,35 @@ class RequestHandler:
         """
         if fmt is None:
             fmt = self.default_format
+        if self._validate:
+            try:
+                self.validate(data, schema.response)
+            except Exception as e:
+                data = error_response(e)
+        return fmt, self._encoders[fmt](data)
+
+    def encode_results(self, results, fmt=None):
+        """
+        Encode a list of results using the requested format.
+
+        Any result that cannot be encoded is replaced with an error response,
+        rather than failing the entire list.
+
+        Returns the response format and the encoded data.
+        """
         try:
-            self.validate(data, schema.response)
-        except Exception as e:
-            data = error_response(e)
-        return fmt, self.codecs[fmt].encode(data)
+            return self.encode(results, fmt)
+        except Exception:
+            pass
+
+        encode = self._encoders[fmt or self.default_format]
+        for i, r in enumerate(results):
+            try:
+                encode(r)
+            except Exception as e:
+                results[i] = error_response(e)
+
+        return self.encode(results, fmt)
 
     def decode(self, data, fmt=None):
         """
@@ -429,8 +782,9 @@ class RequestHandler:
         """
         if fmt is None:
             fmt = self.default_format
-        data = self.codecs[fmt].decode(data)
-        self.validate(data, schema.request)
+        data = self._decoders[fmt](data)
+        if self._validate:
+            self.validate(data, schema.request)
         return data
 
     def handle(self, request, headers):
@@ -439,8 +793,8 @@ class RequestHandler:
 
         Arguments
         ---------
-        request : str
-            Encoded request string.
+        request : bytes
+            Encoded request body.
         headers : dict
             Dictionary of headers from the posted request.  Valid keys are:
 
@@ -459,29 +813,16 @@ class RequestHandler:
             The encoded response string
         """
         request_format = response_format = self.default_format
-        encode = lambda d: self.encode(d, response_format)
 
         try:
-            # parse request format
+            # parse request and response formats
             content_type = headers.get("Content-Type", request_format)
-            if content_type not in self.codecs:
-                raise ValueError(f"Not able to decode media type {content_type}")
-            # Default to using the same response format as the request
-            request_format = response_format = content_type
-
-            # parse response format
-            if "Accept" in headers:
-                accept_types = [v.strip() for v in headers["Accept"].split(",")]
-                if "*/*" in accept_types or "application/*" in accept_types:
-                    response_format = request_format
-                else:
-                    for t in accept_types:
-                        if t in self.codecs:
-                            response_format = t
-                            break
-                    else:
-                        msg = f"Not able to encode any media type matching {headers['Accept']}"
-                        raise ValueError(msg)
+            accept = headers.get("Accept")
+            request_format, response_format = negotiate(content_type, accept, self._formats)
+            if response_format is None:
+                # report the error using the same format as the request
+                response_format = request_format
+                raise ValueError(f"Not able to encode any media type matching {accept}")
 
             # decode request
             request_obj = self.decode(request, request_format)
@@ -489,33 +830,33 @@ class RequestHandler:
             # parse single request
             if isinstance(request_obj, dict):
                 result = self.invoke(request_obj)
-                return encode(result)
+                return self.encode(result, response_format)
 
             if not isinstance(request_obj, list):
                 raise TypeError("Unexpected type in request")
 
             # optionally allow requests to continue to the next item if an error
             # is raised for any request in the list
-            xopts = [v.strip() for v in headers.get("X-Tuber-Options", "").split(",")]
+            xopts = parse_options(headers.get("X-Tuber-Options", ""))
             continue_on_error = "continue-on-error" in xopts
 
             # parse sequence of requests
-            results = [None for r in request_obj]
-            early_bail = False
-            for i, r in enumerate(request_obj):
-                if early_bail:
-                    results[i] = error_response("Something went wrong in a preceding call")
-                    continue
+            results = []
+            invoke = self.invoke
+            append = results.append
+            for r in request_obj:
+                result = invoke(r)
+                append(result)
 
-                results[i] = self.invoke(r)
+                if "error" in result and not continue_on_error:
+                    # skip all remaining requests
+                    results.extend([_EARLY_BAIL_ERROR] * (len(request_obj) - len(results)))
+                    break
 
-                if "error" in results[i] and not continue_on_error:
-                    early_bail = True
-
-            return encode(results)
+            return self.encode_results(results, response_format)
 
         except Exception as e:
-            return encode(error_response(e))
+            return self.encode(error_response(e), response_format)
 
     def invoke(self, request):
         """
@@ -531,34 +872,29 @@ class RequestHandler:
         """
 
         try:
-            if not ("object" in request and "method" in request):
+            objname = request.get("object")
+            methodname = request.get("method")
+            if objname is None or methodname is None:
                 return self.describe(request)
 
-            objname = request["object"]
-            obj = self.registry[objname]
-
-            methodname = request["method"]
-            method = getattr(obj, methodname)
+            method, record_warnings = self.lookup_method(objname, methodname)
 
-            args = request.get("args", [])
+            args = request.get("args", _NO_ARGS)
             if not isinstance(args, list):
                 raise TypeError(f"Argument 'args' for method {objname}.{methodname} must be a list.")
 
-            kwargs = request.get("kwargs", {})
+            kwargs = request.get("kwargs", _NO_KWARGS)
             if not isinstance(kwargs, dict):
                 raise TypeError(f"Argument 'kwargs' for method {objname}.{methodname} must be a dict.")
 
         except Exception as e:
             return error_response(e)
 
+        if not record_warnings:
+            return call_method(method, args, kwargs)
+
         with warnings.catch_warnings(record=True) as wlist:
-            try:
-                response = result_response(method(*args, **kwargs))
-            except Exception:
-                # exclude this frame from exception traceback
-                t, v, tb = sys.exc_info()
-                message = "".join(traceback.format_exception(t, v, tb.tb_next))
-                response = error_response(message)
+            response = call_method(method, args, kwargs)
 
             if len(wlist):
                 response["warnings"] = [str(w.message) for w in wlist]
@@ -584,10 +920,10 @@ class RequestHandler:
         correctness and robustness than performance here.
         """
 
-        objname = request["object"] if "object" in request else None
-        methodname = request["method"] if "method" in request else None
-        propertyname = request["property"] if "property" in request else None
-        resolve = request["resolve"] if "resolve" in request else False
+        objname = request.get("object")
+        methodname = request.get("method")
+        propertyname = request.get("property")
+        resolve = request.get("resolve", False)
 
         if not objname and not methodname and not propertyname:
             # registry metadata
@@ -599,7 +935,7 @@ class RequestHandler:
 
             return result_response(objects=objects)
 
-        obj = self.registry[objname]
+        obj = self.lookup(objname)
 
         if not methodname and not propertyname:
             # Object metadata.
@@ -617,7 +953,7 @@ class RequestHandler:
             attr = getattr(obj, propertyname)
 
             # Complex case: return a description of an object
-            if getattr(attr, "__tuber_object__", False):
+            if is_tuber_object(attr):
                 return result_response(**resolve_object(attr, recursive=resolve))
 
             # Simple case: just a property evaluation
@@ -633,7 +969,7 @@ class RequestHandler:
         return self.handle(*args, **kwargs)
 
 
-def run(registry, json_module="json", port=80, webroot=None, max_age=3600, validate=False):
+def run(registry, json_module="json", port=80, webroot=None, max_age=3600, validate=False, capture_warnings=True):
     """
     Run tuber server with the given registry.
 
@@ -643,6 +979,8 @@ def run(registry, json_module="json", port=80, webroot=None, max_age=3600, valid
         Dictionary of user-defined objects with properties and methods.
     json_module : str
         Python package to use for encoding and decoding JSON requests.
+        orjson is faster, but encodes NaN and infinities as null and does not
+        handle integers beyond 64 bits.
     port : int
         Port on which to run the server
     webroot : str
@@ -651,6 +989,8 @@ def run(registry, json_module="json", port=80, webroot=None, max_age=3600, valid
         Maximum cache residency for static (file) assets
     validate : bool
         If True, validate incoming and outgoing data packets using jsonschema
+    capture_warnings : bool
+        If True, forward warnings raised by method calls to the client
     """
     # setup environment
     os.environ["TUBER_SERVER"] = "1"
@@ -662,7 +1002,7 @@ def run(registry, json_module="json", port=80, webroot=None, max_age=3600, valid
         from ._tuber_runtime import run_server
 
     # prepare handler
-    handler = RequestHandler(registry, json_module, validate=validate)
+    handler = RequestHandler(registry, json_module, validate=validate, capture_warnings=capture_warnings)
 
     # run
     run_server(handler, port=port, webroot=webroot, max_age=max_age)
@@ -680,7 +1020,14 @@ def load_registry(filename):
     mod = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(mod)
 
-    return mod.registry
+    # The registry may be a dictionary, or a callable returning one. The
+    # latter allows registry files to defer constructing their objects until
+    # the server actually needs them.
+    registry = mod.registry
+    if callable(registry):
+        registry = registry()
+
+    return registry
 
 
 def main(registry=None):
@@ -720,6 +1067,12 @@ def main(registry=None):
     P.add_argument(
         "--validate", action="store_true", help="Validate incoming and outgoing data packets using jsonschema"
     )
+    P.add_argument(
+        "--no-capture-warnings",
+        action="store_false",
+        dest="capture_warnings",
+        help="Do not forward warnings raised by method calls to the client",
+    )
     args = P.parse_args()
 
     # setup environment